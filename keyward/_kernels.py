@@ -0,0 +1,16 @@
+import numba
+import numpy as np
+
+
+@numba.njit(parallel=True, cache=True)
+def match_rows(ids, columns, values):
+    """Return the ids whose row equals `values[j]` in every stacked column `columns[j]`."""
+    mask = np.empty(ids.size, np.bool_)
+    for i in numba.prange(ids.size):
+        match = True
+        for j in range(values.size):
+            if columns[j, i] != values[j]:
+                match = False
+                break
+        mask[i] = match
+    return ids[mask]
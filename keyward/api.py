@@ -1,63 +1,109 @@
+import asyncio
+import functools
+import threading
 import pandas as pd
 from typing import Any, Dict, List, Optional, Union
 
+from .table_operations import TableOperations, table_operations
+
+
+class _LoopRunner:
+    """Run coroutines to completion on one persistent event loop in a daemon thread."""
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        try:
+            threading.Thread(target=self.loop.run_forever, daemon=True).start()
+        except RuntimeError as e:
+            # e.g. under Pyodide, where grist.browser.api runs and threads are unavailable
+            self.loop.close()
+            raise RuntimeError(
+                "keyward's *_sync methods need a background thread, which this environment "
+                "cannot start; await the async methods instead"
+            ) from e
+
+    def run(self, coro):
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+
+
+_runner = None
+_runner_lock = threading.Lock()
+
+
+def _get_runner() -> _LoopRunner:
+    """Start the background loop on first use, so importing keyward never spawns a thread."""
+    global _runner
+    with _runner_lock:
+        if _runner is None:
+            _runner = _LoopRunner()
+    return _runner
+
+
+def _sync(func, name):
+    """Wrap coroutine function `name` for sync callers; raises if called from inside a running loop."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass  # no loop in this thread, so blocking is safe
+        else:
+            # Blocking here would stall the caller's loop, or deadlock on the runner's own
+            raise RuntimeError(
+                f"{name}_sync cannot be called while an event loop is running; await {name}() instead"
+            )
+        return _get_runner().run(func(*args, **kwargs))
+    return wrapper
+
+
 class KeywardApi:
+    # Operations that also get a blocking `<name>_sync` sibling
+    _ASYNC_OPS = (
+        'create_table', 'add_record', 'add_records', 'get_table', 'update_record',
+        'delete_record', 'merge_tables', 'create_from_dataframe', 'bulk_update_records',
+        'bulk_delete_records', 'get_attachment_url',
+    )
+
     def __init__(self):
         self.connected = True
-    
-    async def create_table(self, table_name, columns):
-        """Creates a table with specified columns"""
-        from .table_operations import table_operations
-        return await table_operations.create_table(table_name, columns)
+
+        # Blocking variants for scripts (e.g. add_record_sync), all sharing one event loop
+        for name in self._ASYNC_OPS:
+            setattr(self, f'{name}_sync', _sync(getattr(self, name), name))
+
+    # Operations whose parameters match TableOperations are bound directly,
+    # so calls skip an extra wrapper coroutine
+    create_table = staticmethod(TableOperations.create_table)
+    get_table = staticmethod(TableOperations.fetch_table_to_dataframe)
+    merge_tables = staticmethod(TableOperations.merge_tables)
+    bulk_update_records = staticmethod(TableOperations.bulk_update_records)
     
     async def add_record(self, table_name, record):
         """Add a single record to a table"""
-        from .table_operations import table_operations
         return await table_operations.add_data(table_name, record)
     
     async def add_records(self, table_name, records):
         """Add multiple records to a table"""
-        from .table_operations import table_operations
         return await table_operations.add_data(table_name, records)
     
-    async def get_table(self, table_name):
-        """Get table data as a DataFrame"""
-        from .table_operations import table_operations
-        return await table_operations.fetch_table_to_dataframe(table_name)
-    
     async def update_record(self, table_name, record_id, updates):
         """Update a record in a table"""
-        from .table_operations import table_operations
         return await table_operations.update_table(table_name, record_id, updates)
     
     async def delete_record(self, table_name, record_id):
         """Delete a record from a table"""
-        from .table_operations import table_operations
         return await table_operations.delete_data(table_name, record_id)
     
-    async def merge_tables(self, sources, target=None, create_new=False):
-        """Merge tables together"""
-        from .table_operations import table_operations
-        return await table_operations.merge_tables(sources, target, create_new)
-    
     async def create_from_dataframe(self, table_name, dataframe):
         """Create a table from a pandas DataFrame"""
-        from .table_operations import table_operations
         return await table_operations.create_table_from_dataframe(table_name, dataframe)
     
-    async def bulk_update_records(self, table_name, updates):
-        """Update multiple records at once"""
-        from .table_operations import table_operations
-        return await table_operations.bulk_update_records(table_name, updates)
-    
     async def bulk_delete_records(self, table_name, record_ids):
         """Delete multiple records at once"""
-        from .table_operations import table_operations
         return await table_operations.bulk_delete_records(table_name, record_ids)
     
     async def get_attachment_url(self, table_name, column_name, record_id):
         """Get URL for an attachment"""
-        from .table_operations import table_operations
         return await table_operations.get_attachment_url(table_name, column_name, record_id)
 
 # Create a singleton instance
@@ -1,5 +1,392 @@
+import asyncio
+import functools
+import itertools
+import operator
+import numpy as np
 import pandas as pd
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Awaitable, Dict, Iterable, Iterator, List, Optional, Union
+
+try:
+    import pyarrow as pa
+except ImportError:  # optional: DataFrame records are built with pandas instead
+    pa = None
+
+# Grist system columns that are never copied between tables
+_SYS_COLS = frozenset(('id', 'manualSort'))
+
+# Number of records sent per create request; larger inserts are split
+CHUNK_SIZE = 1000
+
+# Maximum number of Grist requests issued concurrently by a single operation
+MAX_CONCURRENCY = 8
+
+# add_data calls smaller than CHUNK_SIZE for the same table are sent to Grist as a
+# single create. A lone call goes out on the next loop tick; once calls overlap,
+# the batch stays open this long for more
+COALESCE_WINDOW_MS = 5
+
+# Maximum number of per-row updates in flight when bulk_update_records looks for failing rows
+MAX_INFLIGHT_UPDATES = 64
+
+# Column type inference scans this many leading values in Python before handing
+# a column of leading nulls to pandas
+_SAMPLE_HEAD = 16
+
+# Map pandas dtype kind codes to our types; anything else (e.g. category, string) is Text
+_KIND_TYPES = {
+    'i': 'Numeric',
+    'u': 'Numeric',
+    'f': 'Numeric',
+    'b': 'Bool',
+    'M': 'Date',
+    'O': 'Text',
+}
+
+# Opt-in numba matcher for bulk_delete_where. Even with its on-disk cache, the first
+# call in a process costs more than the pandas mask saves, so it only pays off in
+# long-running processes that match huge tables repeatedly
+USE_NUMBA_MATCHER = False
+
+# Tables with at least this many rows are matched with the numba kernel when enabled
+NUMBA_MIN_ROWS = 100_000
+
+
+_gapi = None
+
+
+def _get_gapi():
+    """Import grist.browser.api on first use and reuse the module afterwards."""
+    global _gapi
+    if _gapi is None:
+        import grist.browser.api as gapi
+        _gapi = gapi
+    return _gapi
+
+
+def _get_doc_api():
+    """Return Grist's document API if this environment exposes user actions, else None."""
+    doc_api = getattr(_get_gapi().grist, 'docApi', None)
+    return doc_api if hasattr(doc_api, 'applyUserActions') else None
+
+
+def _add_table_action(table_name: str, columns: Dict[str, str]) -> list:
+    return ['AddTable', table_name, [{'id': col_name, 'type': col_type} for col_name, col_type in columns.items()]]
+
+
+def _remove_table_action(table_id: str) -> list:
+    return ['RemoveTable', table_id]
+
+
+def _bulk_add_action(table_name: str, row_count: int, columns: Dict[str, List[Any]]) -> list:
+    # None row IDs let Grist assign new ones
+    return ['BulkAddRecord', table_name, [None] * row_count, columns]
+
+
+async def _apply_user_actions(doc_api, actions: List[list]) -> List[Any]:
+    """Apply user actions in one request and return each action's return value."""
+    result = await doc_api.applyUserActions(actions)
+    if hasattr(result, 'to_py'):  # JS object when running under Pyodide
+        result = result.to_py()
+    return result['retValues']
+
+
+def _bulk_add_actions(table_name: str, records: List[Dict[str, Any]]) -> List[list]:
+    """
+    Build column-major BulkAddRecord actions for records, in order.
+    
+    Each run of consecutive records with the same keys gets its own action, so a
+    key missing from a record keeps the column default instead of becoming None.
+    """
+    actions = []
+    for _, run in itertools.groupby(records, key=dict.keys):
+        run = list(run)
+        columns = {col: [record[col] for record in run] for col in run[0]}
+        actions.append(_bulk_add_action(table_name, len(run), columns))
+    return actions
+
+
+def _get_table_ops(table_name: str):
+    """Return a reusable Grist TableOperations handle for `table_name`."""
+    return _cached_table_ops(id(_get_gapi().grist), table_name)
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_table_ops(grist_id: int, table_name: str):
+    # Keyed by the grist client too, so a replaced client never gets handles bound
+    # to the old one; each cached handle keeps its client alive, so ids stay unique
+    gapi = _get_gapi()
+    return gapi.TableOperations(gapi.grist, table_name)
+
+
+async def _gather_bounded(aws: Iterable[Awaitable[Any]], limit: int = MAX_CONCURRENCY,
+                          return_exceptions: bool = False) -> List[Any]:
+    """Await all awaitables concurrently, with at most `limit` in flight at once."""
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(aw):
+        async with semaphore:
+            return await aw
+
+    return await asyncio.gather(*(run(aw) for aw in aws), return_exceptions=return_exceptions)
+
+
+def _to_records(table_data: Dict[str, List[Any]], columns: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    """Transpose Grist's column-oriented table data into a list of records."""
+    if columns is None:
+        columns = [col for col in table_data if col not in _SYS_COLS]
+    # dtype=object keeps the original Python values (no NaN for None, no numpy scalars)
+    df = pd.DataFrame(table_data, columns=columns, dtype=object)
+    return df.to_dict('records')
+
+
+def _frame_to_records(df: pd.DataFrame) -> List[Dict[str, Any]]:
+    """Convert a DataFrame to records, with every missing value (NA, NaN, NaT) as None."""
+    # Arrow turns labels like 0 into '0', which would no longer match the created columns
+    if pa is not None and all(isinstance(col, str) for col in df.columns):
+        try:
+            # One columnar pass that emits nulls as None directly
+            return pa.Table.from_pandas(df, preserve_index=False).to_pylist()
+        except pa.ArrowException:
+            pass  # e.g. mixed-type object columns; use pandas below
+    return df.astype(object).where(df.notna(), None).to_dict('records')
+
+
+def _frame_to_columns(df: pd.DataFrame) -> Dict[Any, List[Any]]:
+    """Convert a DataFrame to column lists, with every missing value (NA, NaN, NaT) as None."""
+    if pa is not None and all(isinstance(col, str) for col in df.columns):
+        try:
+            return pa.Table.from_pandas(df, preserve_index=False).to_pydict()
+        except pa.ArrowException:
+            pass  # e.g. mixed-type object columns; use pandas below
+    return {col: values.astype(object).where(values.notna(), None).tolist() for col, values in df.items()}
+
+
+def _infer_column_types(table_data: Dict[str, List[Any]], columns: Optional[Iterable[str]] = None) -> Dict[str, str]:
+    """Guess a column type for each column from its first non-None value."""
+    if columns is None:
+        columns = [col for col in table_data if col not in _SYS_COLS]
+    type_map = {
+        'int': 'Numeric',
+        'float': 'Numeric',
+        'bool': 'Bool',
+        'str': 'Text',
+        'NoneType': 'Text'
+    }
+    cols = {}
+    for col in columns:
+        values = table_data[col]
+        sample = next((v for v in itertools.islice(values, _SAMPLE_HEAD) if v is not None), None)
+        if sample is None and len(values) > _SAMPLE_HEAD:
+            # Leading nulls: let pandas find the first non-null value in C
+            index = pd.Series(values, dtype=object).first_valid_index()
+            sample = None if index is None else values[index]
+        cols[col] = type_map.get(type(sample).__name__, 'Text')
+    return cols
+
+
+async def _chunked_create(create, records: List[Dict[str, Any]], chunksize: int = CHUNK_SIZE) -> List[int]:
+    """
+    Create records in chunks of `chunksize`, one chunk after another so rows keep their order.
+    
+    Not atomic: if a chunk fails, the chunks before it stay inserted.
+    """
+    row_ids = []
+    for chunk in _chunks(records, chunksize):
+        row_ids.extend(await create(chunk))
+    return row_ids
+
+
+async def _create(table_name: str, records: List[Dict[str, Any]]) -> List[int]:
+    """Create records in a table, splitting large inserts into chunks."""
+    doc_api = _get_doc_api()
+    if doc_api is None:
+        create = _get_table_ops(table_name).create
+    else:
+        # Send rows column-major, so each column name goes over the wire once per
+        # action; all actions of a chunk go in one request and apply together
+        async def create(chunk):
+            ret_values = await _apply_user_actions(doc_api, _bulk_add_actions(table_name, chunk))
+            return [row_id for row_ids in ret_values for row_id in row_ids]
+    if len(records) > CHUNK_SIZE:
+        return await _chunked_create(create, records)
+    return list(await create(records))
+
+
+async def _bulk_add_columns(doc_api, table_name: str, columns: Dict[Any, List[Any]], row_count: int) -> List[int]:
+    """Insert column lists of equal length, one BulkAddRecord request per CHUNK_SIZE rows."""
+    row_ids = []
+    for start in range(0, row_count, CHUNK_SIZE):
+        stop = min(start + CHUNK_SIZE, row_count)
+        chunk = {col: values[start:stop] for col, values in columns.items()}
+        ret_values = await _apply_user_actions(doc_api, [_bulk_add_action(table_name, stop - start, chunk)])
+        row_ids.extend(ret_values[0])
+    return row_ids
+
+
+def _resolve(fut: asyncio.Future, result: Any = None, exception: Optional[BaseException] = None) -> None:
+    """Complete a caller's future unless it was already cancelled."""
+    if fut.done():
+        return
+    if exception is not None:
+        fut.set_exception(exception)
+    else:
+        fut.set_result(result)
+
+
+class _Batch:
+    """Submissions waiting to be sent together: [(records, future), ...] and their record count."""
+    __slots__ = ('entries', 'size')
+
+    def __init__(self):
+        self.entries = []
+        self.size = 0
+
+
+class _Coalescer:
+    """
+    Buffer small add_data submissions per table and send each batch as one create.
+    
+    A batch never holds more than CHUNK_SIZE records, so it always goes out as a
+    single request and either applies fully or not at all.
+    """
+
+    def __init__(self, flush_ms: float = COALESCE_WINDOW_MS):
+        self.flush_delay = flush_ms / 1000
+        # Open batches by (event loop, table_name, key set)
+        self.queue = {}
+        self.tasks = set()
+
+    def submit(self, table_name: str, records: List[Dict[str, Any]], fut: asyncio.Future) -> None:
+        """Queue records; `fut` resolves to their row IDs, or to the create's exception."""
+        if _get_doc_api() is not None:
+            # BulkAddRecord keeps column defaults for each key set, so any records can share a batch
+            keys = None
+        else:
+            # table_ops.create sends None for keys a record lacks, so only records
+            # with the same keys can share a create
+            keys = frozenset(records[0]) if records else frozenset()
+            if any(record.keys() != keys for record in records):
+                batch = _Batch()
+                batch.entries.append((records, fut))
+                self._start(self._flush(table_name, batch))
+                return
+        # Keyed by event loop too: futures only complete on their own loop
+        key = (asyncio.get_running_loop(), table_name, keys)
+        batch = self.queue.get(key)
+        if batch is not None and batch.size + len(records) > CHUNK_SIZE:
+            # Adding these records would make the batch span several requests; send it now
+            del self.queue[key]
+            self._start(self._flush(table_name, batch))
+            batch = None
+        if batch is None:
+            batch = self.queue[key] = _Batch()
+            self._start(self._flush_later(key, batch))
+        batch.entries.append((records, fut))
+        batch.size += len(records)
+
+    def _start(self, coro) -> None:
+        task = asyncio.ensure_future(coro)
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+
+    async def _flush_later(self, key, batch: _Batch) -> None:
+        # Let calls already scheduled on this tick join, then send unless others are arriving
+        await asyncio.sleep(0)
+        if len(batch.entries) > 1:
+            await asyncio.sleep(self.flush_delay)
+        # The batch may already have been sent because it filled up
+        if self.queue.get(key) is batch:
+            del self.queue[key]
+            await self._flush(key[1], batch)
+
+    async def _flush(self, table_name: str, batch: _Batch) -> None:
+        pending = batch.entries
+        try:
+            result = await _create(table_name, [r for records, _ in pending for r in records])
+        except Exception as e:
+            if len(pending) == 1:
+                _resolve(pending[0][1], exception=e)
+                return
+            # Nothing was written, so retry each submission on its own and let a bad
+            # record fail only its caller
+            results = await asyncio.gather(
+                *(_create(table_name, records) for records, _ in pending), return_exceptions=True
+            )
+            for (_, fut), res in zip(pending, results):
+                if isinstance(res, Exception):
+                    _resolve(fut, exception=res)
+                else:
+                    _resolve(fut, res)
+            return
+
+        offset = 0
+        for records, fut in pending:
+            _resolve(fut, result[offset:offset + len(records)])
+            offset += len(records)
+
+
+_coalescer = _Coalescer()
+
+
+def _column_equals(column: pd.Series, val: Any) -> pd.Series:
+    """Boolean mask of the cells in `column` equal to `val`."""
+    if val is None:
+        # Only None itself, as in a plain `==` check; isna() would also match NaN
+        return column.map(lambda cell: cell is None).astype(bool)
+    if not pd.api.types.is_scalar(val):
+        # e.g. ChoiceList cells like ['L', 'a']; eq() would compare element by element
+        return column.map(lambda cell: cell == val).astype(bool)
+    return column.eq(val)
+
+
+def _match_rows(table_data: Dict[str, List[Any]], where: Dict[str, Any]) -> List[int]:
+    """Return the ids of the rows whose cells equal `where[col]` in every column."""
+    # dtype=object compares the original Python values: no int -> float64
+    # conversion for columns holding None, which would round large ints
+    df = pd.DataFrame({col: table_data[col] for col in ('id', *where)}, dtype=object)
+    mask = functools.reduce(operator.and_, (
+        _column_equals(df[col], val) for col, val in where.items()
+    ))
+    return df.loc[mask, 'id'].astype(int).tolist()
+
+
+def _match_rows_compiled(table_data: Dict[str, List[Any]], where: Dict[str, Any]) -> Optional[List[int]]:
+    """Match rows with the numba kernel, or return None if pandas should handle it."""
+    if not USE_NUMBA_MATCHER or not all(isinstance(val, (int, float)) for val in where.values()):
+        return None
+    try:
+        from ._kernels import match_rows
+    except ImportError:  # numba is optional
+        return None
+    ids = np.asarray(table_data['id'], dtype=np.int64)
+    if ids.size < NUMBA_MIN_ROWS:
+        return None
+    arrays = [np.asarray(table_data[col]) for col in where]
+    kinds = {arr.dtype.kind for arr in arrays}
+    # Stack everything as int64 or float64, so the kernel only ever has two cached
+    # signatures, but only when that is exact. Anything else goes to pandas: Text
+    # columns and columns holding None (object arrays), uint64, ints beyond 2**53
+    # compared with floats, and int and float columns mixed
+    if kinds <= {'b', 'i'} and all(isinstance(val, int) and -2**63 <= val < 2**63 for val in where.values()):
+        dtype = np.int64
+    elif kinds == {'f'} and all(isinstance(val, float) or abs(val) <= 2**53 for val in where.values()):
+        dtype = np.float64
+    else:
+        return None
+    columns = np.vstack(arrays).astype(dtype, copy=False)
+    values = np.array(list(where.values()), dtype=dtype)
+    return match_rows(ids, columns, values).tolist()
+
+
+def _chunks(records: Iterable[Dict[str, Any]], size: int = CHUNK_SIZE) -> Iterator[List[Dict[str, Any]]]:
+    """Yield successive lists of at most `size` records."""
+    it = iter(records)
+    while True:
+        chunk = list(itertools.islice(it, size))
+        if not chunk:
+            return
+        yield chunk
+
 
 class TableOperations:
     @staticmethod
@@ -15,18 +402,39 @@ class TableOperations:
             bool: True if successful, False otherwise
         """
         try:
-            import grist.browser.api as gapi
-            
-            table_ops = gapi.TableOperations(gapi.grist, table_name)
-            
-            # Create a dummy record with the right structure
-            dummy_record = {col_name: "" if col_type == "Text" else 0 for col_name, col_type in columns.items()}
-            
-            result = await table_ops.create([dummy_record])
+            doc_api = _get_doc_api()
+            created = False
+            if doc_api is not None:
+                # Create the schema directly, without a dummy row round trip
+                ret_values = await _apply_user_actions(doc_api, [_add_table_action(table_name, columns)])
+                table_id = ret_values[0]['table_id']
+                col_ids = [col for col in ret_values[0]['columns'] if col not in _SYS_COLS]
+                
+                if table_id != table_name:
+                    # Grist de-duplicated or normalized the id (e.g. 'Target2' if 'Target'
+                    # exists): drop its table and use the dummy record flow below, which
+                    # accepts an existing table
+                    await _apply_user_actions(doc_api, [_remove_table_action(table_id)])
+                elif col_ids != list(columns):
+                    # Grist normalized some column ids (e.g. 'First Name' -> 'First_Name'),
+                    # so writes using the given names would fail
+                    await _apply_user_actions(doc_api, [_remove_table_action(table_id)])
+                    print(f"❌ Error creating table: Grist renamed columns {list(columns)} to {col_ids}")
+                    return False
+                else:
+                    created = True
             
-            # Clean up the dummy record
-            if result and len(result) > 0:
-                await table_ops.destroy([result[0]])
+            if not created:
+                table_ops = _get_table_ops(table_name)
+                
+                # Create a dummy record with the right structure
+                dummy_record = {col_name: "" if col_type == "Text" else 0 for col_name, col_type in columns.items()}
+                
+                result = await table_ops.create([dummy_record])
+                
+                # Clean up the dummy record
+                if result and len(result) > 0:
+                    await table_ops.destroy([result[0]])
                 
             print(f"✅ Table '{table_name}' created with {len(columns)} columns")
             return True
@@ -35,25 +443,32 @@ class TableOperations:
             return False
     
     @staticmethod
-    async def add_data(table_name: str, records: Union[Dict[str, Any], List[Dict[str, Any]]]) -> Optional[List[int]]:
+    async def add_data(table_name: str, records: Union[Dict[str, Any], List[Dict[str, Any]]],
+                       *, _is_list: bool = False) -> Optional[List[int]]:
         """
         Add records to a table.
         
         Args:
             table_name (str): Table to insert into
             records (dict or list): Dict or list of dicts mapping column name to value
+            _is_list (bool): Internal; callers that always pass a list set this to skip the type check
             
         Returns:
-            List of new row IDs, or None on error
+            List of new row IDs, or None on error. Inserts larger than CHUNK_SIZE
+            are sent in several requests; if one fails, the earlier chunks stay
+            inserted.
         """
-        if not isinstance(records, list):
+        if not _is_list and not isinstance(records, list):
             records = [records]
             
         try:
-            import grist.browser.api as gapi
-            
-            table_ops = gapi.TableOperations(gapi.grist, table_name)
-            result = await table_ops.create(records)
+            if len(records) < CHUNK_SIZE:
+                # Small inserts are batched with concurrent ones for the same table
+                fut = asyncio.get_running_loop().create_future()
+                _coalescer.submit(table_name, records, fut)
+                result = await fut
+            else:
+                result = await _create(table_name, records)
             print(f"✅ Added {len(result)} records to '{table_name}'")
             return result
         except Exception as e:
@@ -72,11 +487,17 @@ class TableOperations:
             DataFrame without system columns
         """
         try:
-            import grist.browser.api as gapi
+            gapi = _get_gapi()
+            
+            # Prefer Arrow when available: columns go to pandas without reboxing each value
+            if hasattr(gapi.grist, 'fetch_table_arrow'):
+                table = await gapi.grist.fetch_table_arrow(table_name)
+                table = table.select([c for c in table.column_names if c not in _SYS_COLS])
+                return table.to_pandas(split_blocks=True, self_destruct=True)
             
             table_data = await gapi.grist.fetch_table(table_name)
             df = pd.DataFrame({k: v for k, v in table_data.items() 
-                              if k not in ['id', 'manualSort']})
+                              if k not in _SYS_COLS})
             return df
         except Exception as e:
             print(f"❌ Error fetching table: {e}")
@@ -96,9 +517,7 @@ class TableOperations:
             True on success, False on error
         """
         try:
-            import grist.browser.api as gapi
-            
-            table_ops = gapi.TableOperations(gapi.grist, table_name)
+            table_ops = _get_table_ops(table_name)
             await table_ops.update([{"id": row_id, **updates}])
             return True
         except Exception as e:
@@ -118,9 +537,7 @@ class TableOperations:
             True on success, False on error
         """
         try:
-            import grist.browser.api as gapi
-            
-            table_ops = gapi.TableOperations(gapi.grist, table_name)
+            table_ops = _get_table_ops(table_name)
             await table_ops.destroy(row_ids if isinstance(row_ids, list) else [row_ids])
             return True
         except Exception as e:
@@ -143,27 +560,21 @@ class TableOperations:
             return None
             
         try:
-            # Map pandas dtypes to our types
-            type_map = {
-                'int64': 'Numeric',
-                'int32': 'Numeric',
-                'float64': 'Numeric',
-                'float32': 'Numeric',
-                'bool': 'Bool',
-                'datetime64[ns]': 'Date',
-                'object': 'Text',
-                'category': 'Text',
-            }
-            
             # Create the table
-            cols = {col: type_map.get(str(dt), 'Text') for col, dt in df.dtypes.items()}
+            cols = {col: _KIND_TYPES.get(dt.kind, 'Text') for col, dt in df.dtypes.items()}
             if not await TableOperations.create_table(table_name, cols):
                 return None
                 
             # Add the data
-            records = df.replace({pd.NA: None}).to_dict('records')
-            if await TableOperations.add_data(table_name, records) is None:
-                return None
+            doc_api = _get_doc_api()
+            if doc_api is not None:
+                # Every row has the same keys, so the frame's columns go out as they are
+                row_ids = await _bulk_add_columns(doc_api, table_name, _frame_to_columns(df), len(df))
+                print(f"✅ Added {len(row_ids)} records to '{table_name}'")
+            else:
+                records = _frame_to_records(df)
+                if await TableOperations.add_data(table_name, records, _is_list=True) is None:
+                    return None
                 
             return table_name
         except Exception as e:
@@ -189,6 +600,9 @@ class TableOperations:
         """
         Apply multiple row updates in a single operation.
         
+        If the batch fails, the updates are retried one row per request so
+        that only the failing rows are reported as failed.
+        
         Args:
             table_name (str): The table to update
             updates (list): List of dicts each with 'id' key for row ID plus fields to update
@@ -196,13 +610,26 @@ class TableOperations:
         Returns:
             List of booleans indicating success of each update
         """
-        results = []
         try:
-            import grist.browser.api as gapi
-            
-            table_ops = gapi.TableOperations(gapi.grist, table_name)
-            await table_ops.update(updates)
-            return [True] * len(updates)
+            table_ops = _get_table_ops(table_name)
+            try:
+                await table_ops.update(updates)
+                return [True] * len(updates)
+            except Exception as e:
+                if len(updates) <= 1:
+                    raise
+                print(f"❌ Error in bulk update: {e}; retrying row by row")
+            
+            # Updates only set values, so re-sending rows the batch may have applied is harmless
+            results = await _gather_bounded(
+                (table_ops.update([update]) for update in updates),
+                MAX_INFLIGHT_UPDATES,
+                return_exceptions=True,
+            )
+            errors = [r for r in results if isinstance(r, Exception)]
+            if errors:
+                print(f"❌ Error in bulk update: {len(errors)} of {len(updates)} updates failed ({errors[0]})")
+            return [not isinstance(r, Exception) for r in results]
         except Exception as e:
             print(f"❌ Error in bulk update: {e}")
             return [False] * len(updates)
@@ -234,26 +661,20 @@ class TableOperations:
             True on success, False on error
         """
         try:
-            import grist.browser.api as gapi
+            gapi = _get_gapi()
             
             # Fetch the table to find matching rows
             table_data = await gapi.grist.fetch_table(table_name)
             
             # Find rows that match all criteria
-            row_ids = []
-            for i, row_id in enumerate(table_data.get('id', [])):
-                match = True
-                for col, val in where.items():
-                    if col in table_data and i < len(table_data[col]):
-                        if table_data[col][i] != val:
-                            match = False
-                            break
-                    else:
-                        match = False
-                        break
-                
-                if match:
-                    row_ids.append(row_id)
+            if not where:
+                row_ids = list(table_data.get('id', []))
+            elif 'id' not in table_data or any(col not in table_data for col in where):
+                row_ids = []
+            else:
+                row_ids = _match_rows_compiled(table_data, where)
+                if row_ids is None:
+                    row_ids = _match_rows(table_data, where)
                     
             # Delete the matching rows
             if row_ids:
@@ -277,7 +698,7 @@ class TableOperations:
             True on success, False on error
         """
         try:
-            import grist.browser.api as gapi
+            gapi = _get_gapi()
             
             if len(sources) < 1:
                 return False
@@ -285,49 +706,42 @@ class TableOperations:
             tgt = target if target else sources[0]
             srcs = sources if target else sources[1:]
             
-            # Create target table if needed
-            if create_new and srcs:
-                # Fetch schema from first source
-                first_source_data = await gapi.grist.fetch_table(srcs[0])
-                
-                # Determine column types
-                type_map = {
-                    'int': 'Numeric',
-                    'float': 'Numeric',
-                    'bool': 'Bool',
-                    'str': 'Text',
-                    'NoneType': 'Text'
-                }
-                
-                cols = {}
-                for col in first_source_data:
-                    if col not in ('id', 'manualSort'):
-                        # Get non-None value to determine type
-                        sample = next((v for v in first_source_data[col] if v is not None), None)
-                        col_type = type_map.get(type(sample).__name__, 'Text')
-                        cols[col] = col_type
-                
-                # Create the target table
-                await TableOperations.create_table(tgt, cols)
+            # Fetch and transpose sources concurrently; writes wait for their turn so
+            # rows land in the target in source order. A source holds the semaphore
+            # until it is written, so at most MAX_CONCURRENCY are buffered at once.
+            # Tasks acquire it in source order, so the source whose turn it is always
+            # holds it
+            semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+            turns = [asyncio.Event() for _ in range(len(srcs) + 1)]
+            turns[0].set()
+            
+            async def pipeline(i, src):
+                async with semaphore:
+                    src_data = await gapi.grist.fetch_table(src)
+                    
+                    # Convert to records
+                    records = _to_records(src_data)
+                    
+                    await turns[i].wait()
+                    
+                    # Create target table if needed, with schema from first source
+                    if i == 0 and create_new:
+                        if not await TableOperations.create_table(tgt, _infer_column_types(src_data)):
+                            raise RuntimeError(f"could not create target table '{tgt}'")
+                    
+                    # Add to target table
+                    if records:
+                        await TableOperations.add_data(tgt, records, _is_list=True)
+                    
+                    turns[i + 1].set()
             
-            # Copy data from each source
-            for src in srcs:
-                src_data = await gapi.grist.fetch_table(src)
-                
-                # Convert to records
-                records = []
-                row_count = len(src_data.get('id', []))
-                
-                for i in range(row_count):
-                    record = {}
-                    for col in src_data:
-                        if col not in ('id', 'manualSort') and i < len(src_data[col]):
-                            record[col] = src_data[col][i]
-                    records.append(record)
-                
-                # Add to target table
-                if records:
-                    await TableOperations.add_data(tgt, records)
+            tasks = [asyncio.ensure_future(pipeline(i, src)) for i, src in enumerate(srcs)]
+            try:
+                await asyncio.gather(*tasks)
+            except Exception:
+                for task in tasks:
+                    task.cancel()
+                raise
             
             return True
         except Exception as e:
@@ -348,7 +762,7 @@ class TableOperations:
             True on success, False on error
         """
         try:
-            import grist.browser.api as gapi
+            gapi = _get_gapi()
             
             if len(sources) < 1:
                 return False
@@ -356,12 +770,15 @@ class TableOperations:
             tgt = target if target else sources[0]
             srcs = sources if target else sources[1:]
             
+            # Fetch every source once; both passes below reuse the results
+            all_data = await _gather_bounded(gapi.grist.fetch_table(src) for src in sources)
+            fetched = dict(zip(sources, all_data))
+            
             # Find common columns across all sources
             common_cols = None
             
-            for src in sources:
-                src_data = await gapi.grist.fetch_table(src)
-                src_cols = set(col for col in src_data if col not in ('id', 'manualSort'))
+            for src_data in all_data:
+                src_cols = src_data.keys() - _SYS_COLS
                 
                 if common_cols is None:
                     common_cols = src_cols
@@ -374,46 +791,20 @@ class TableOperations:
                 
             # Create target table if needed
             if create_new:
-                # Fetch schema from first source
-                first_source_data = await gapi.grist.fetch_table(sources[0])
-                
-                # Determine column types for common columns
-                type_map = {
-                    'int': 'Numeric',
-                    'float': 'Numeric',
-                    'bool': 'Bool',
-                    'str': 'Text',
-                    'NoneType': 'Text'
-                }
-                
-                cols = {}
-                for col in common_cols:
-                    # Get non-None value to determine type
-                    sample = next((v for v in first_source_data[col] if v is not None), None)
-                    col_type = type_map.get(type(sample).__name__, 'Text')
-                    cols[col] = col_type
-                
-                # Create the target table
-                await TableOperations.create_table(tgt, cols)
+                # Create the target table with types for common columns of the first source
+                if not await TableOperations.create_table(tgt, _infer_column_types(all_data[0], common_cols)):
+                    return False
             
             # Copy data from each source
             for src in srcs:
-                src_data = await gapi.grist.fetch_table(src)
+                src_data = fetched[src]
                 
                 # Convert to records with only common columns
-                records = []
-                row_count = len(src_data.get('id', []))
-                
-                for i in range(row_count):
-                    record = {}
-                    for col in common_cols:
-                        if i < len(src_data[col]):
-                            record[col] = src_data[col][i]
-                    records.append(record)
+                records = _to_records(src_data, list(common_cols))
                 
                 # Add to target table
                 if records:
-                    await TableOperations.add_data(tgt, records)
+                    await TableOperations.add_data(tgt, records, _is_list=True)
             
             return True
         except Exception as e:
@@ -434,7 +825,7 @@ class TableOperations:
             URL string or None on error
         """
         try:
-            import grist.browser.api as gapi
+            gapi = _get_gapi()
             
             # Fetch the specific record
             record = await gapi.grist.fetch_selected_record(row_id)
@@ -8,4 +8,8 @@ setup(
     author="keyward",
     author_email="admin@keyward.io",
     python_requires=">=3.6",
+    extras_require={
+        # Opt-in compiled matcher for bulk_delete_where (USE_NUMBA_MATCHER)
+        "numba": ["numba"],
+    },
 )
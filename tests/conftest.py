@@ -0,0 +1,150 @@
+import asyncio
+import importlib
+import re
+import sys
+import types
+
+import pytest
+
+
+class FakeGrist:
+    """In-memory stand-in for grist.browser.api's `grist` object."""
+
+    def __init__(self):
+        self.tables = {}
+        # (operation, table_name, payload) for every call, in the order they reach Grist
+        self.calls = []
+        # Seconds fetch_table waits before returning each table
+        self.delays = {}
+        # Most creates seen awaiting Grist at the same time
+        self.max_inflight_creates = 0
+        self._inflight_creates = 0
+
+    async def fetch_table(self, table_name):
+        self.calls.append(('fetch', table_name, None))
+        await asyncio.sleep(self.delays.get(table_name, 0))
+        return {col: list(values) for col, values in self.tables[table_name].items()}
+
+    async def fetch_selected_record(self, row_id):
+        return None
+
+
+class FakeTableOperations:
+    """Mimics grist.browser.api.TableOperations; a create with a record containing 'bad' fails as a whole."""
+
+    def __init__(self, grist, table_name):
+        self.grist = grist
+        self.table_name = table_name
+
+    def _table(self):
+        return self.grist.tables.setdefault(self.table_name, {'id': [], 'manualSort': []})
+
+    async def create(self, records):
+        if any('bad' in record for record in records):
+            raise ValueError('invalid record')
+        self.grist.calls.append(('create', self.table_name, records))
+        self.grist._inflight_creates += 1
+        self.grist.max_inflight_creates = max(self.grist.max_inflight_creates, self.grist._inflight_creates)
+        await asyncio.sleep(0)
+        self.grist._inflight_creates -= 1
+        table = self._table()
+        row_ids = []
+        for record in records:
+            row_id = max(table['id'], default=0) + 1
+            for col in record:
+                table.setdefault(col, [None] * len(table['id']))
+            for col, values in table.items():
+                values.append(row_id if col in ('id', 'manualSort') else record.get(col))
+            row_ids.append(row_id)
+        return row_ids
+
+    async def update(self, updates):
+        table = self._table()
+        for update in updates:
+            i = table['id'].index(update['id'])
+            for col, value in update.items():
+                table.setdefault(col, [None] * len(table['id']))[i] = value
+
+    async def destroy(self, row_ids):
+        self.grist.calls.append(('destroy', self.table_name, row_ids))
+        table = self._table()
+        keep = [i for i, row_id in enumerate(table['id']) if row_id not in row_ids]
+        for col in table:
+            table[col] = [table[col][i] for i in keep]
+
+
+class FakeJsProxy:
+    """Stands in for the JS object Pyodide returns from docApi calls."""
+
+    def __init__(self, value):
+        self.value = value
+
+    def to_py(self):
+        return self.value
+
+
+class FakeDocApi:
+    """Mimics grist.docApi.applyUserActions for AddTable, RemoveTable and BulkAddRecord."""
+
+    DEFAULTS = {'Numeric': 0, 'Bool': False, 'Text': ''}
+
+    def __init__(self, grist):
+        self.grist = grist
+        self.types = {}
+
+    async def applyUserActions(self, actions):
+        self.grist.calls.append(('apply', None, actions))
+        ret_values = [getattr(self, action[0])(*action[1:]) for action in actions]
+        return FakeJsProxy({'retValues': ret_values})
+
+    def AddTable(self, table_id, columns):
+        # Like Grist, make ids valid identifiers and de-duplicate the table id
+        base, n = re.sub(r'\W', '_', table_id), 1
+        table_id = base
+        while table_id in self.grist.tables:
+            n += 1
+            table_id = f'{base}{n}'
+        col_ids = [re.sub(r'\W', '_', col['id']) for col in columns]
+        self.grist.tables[table_id] = {'id': [], 'manualSort': [], **{col: [] for col in col_ids}}
+        self.types[table_id] = {col_id: col['type'] for col_id, col in zip(col_ids, columns)}
+        return {'id': len(self.grist.tables), 'table_id': table_id, 'columns': ['manualSort', *col_ids]}
+
+    def RemoveTable(self, table_id):
+        del self.grist.tables[table_id]
+
+    def BulkAddRecord(self, table_id, row_ids, columns):
+        table = self.grist.tables[table_id]
+        types = self.types.get(table_id, {})
+        new_ids = list(range(max(table['id'], default=0) + 1, max(table['id'], default=0) + 1 + len(row_ids)))
+        for col, values in table.items():
+            if col in ('id', 'manualSort'):
+                values.extend(new_ids)
+            elif col in columns:
+                values.extend(columns[col])
+            else:
+                # Keys missing from the action keep the column default
+                values.extend([self.DEFAULTS.get(types.get(col), None)] * len(row_ids))
+        return new_ids
+
+
+@pytest.fixture
+def grist(monkeypatch):
+    """Install a fake grist.browser.api module and reset keyward's cached import of it."""
+    fake = FakeGrist()
+    api = types.ModuleType('grist.browser.api')
+    api.grist = fake
+    api.TableOperations = FakeTableOperations
+    monkeypatch.setitem(sys.modules, 'grist', types.ModuleType('grist'))
+    monkeypatch.setitem(sys.modules, 'grist.browser', types.ModuleType('grist.browser'))
+    monkeypatch.setitem(sys.modules, 'grist.browser.api', api)
+
+    ops = importlib.import_module('keyward.table_operations')
+    monkeypatch.setattr(ops, '_gapi', None)
+    yield fake
+
+
+@pytest.fixture
+def grist_doc_api(grist):
+    """Like `grist`, but exposing docApi, so writes go through user actions."""
+    grist.docApi = FakeDocApi(grist)
+    yield grist
@@ -0,0 +1,42 @@
+import asyncio
+import importlib
+import threading
+
+import pytest
+
+from keyward import keywardApi
+
+api_module = importlib.import_module('keyward.api')
+
+
+def test_sync_method_runs_outside_an_event_loop(grist):
+    assert keywardApi.add_record_sync('T', {'n': 1}) == [1]
+    assert grist.tables['T']['n'] == [1]
+
+
+def test_sync_method_raises_inside_a_running_loop(grist):
+    async def run():
+        keywardApi.add_record_sync('T', {'n': 1})
+
+    with pytest.raises(RuntimeError, match='await add_record'):
+        asyncio.run(run())
+    assert 'T' not in grist.tables
+
+
+def test_sync_method_explains_missing_threads(grist, monkeypatch):
+    def start(self):
+        raise RuntimeError("can't start new thread")
+
+    monkeypatch.setattr(api_module, '_runner', None)
+    monkeypatch.setattr(threading.Thread, 'start', start)
+
+    with pytest.raises(RuntimeError, match='await the async methods'):
+        keywardApi.add_record_sync('T', {'n': 1})
+
+
+def test_sync_alias_error_names_the_public_method(grist):
+    async def run():
+        keywardApi.get_table_sync('T')
+
+    with pytest.raises(RuntimeError, match=r'await get_table\(\)'):
+        asyncio.run(run())
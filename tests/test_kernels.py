@@ -0,0 +1,38 @@
+import importlib
+
+import pytest
+
+pytest.importorskip('numba')
+
+ops = importlib.import_module('keyward.table_operations')
+
+
+@pytest.fixture
+def compiled(monkeypatch):
+    monkeypatch.setattr(ops, 'USE_NUMBA_MATCHER', True)
+    monkeypatch.setattr(ops, 'NUMBA_MIN_ROWS', 1)
+
+
+@pytest.mark.parametrize('table_data, where', [
+    ({'id': [1, 2, 3, 4], 'n': [1, 2, 1, 3], 'm': [5, 5, 6, 5]}, {'n': 1, 'm': 5}),
+    ({'id': [1, 2, 3], 'b': [True, False, True]}, {'b': True}),
+    ({'id': [1, 2, 3], 'x': [0.5, float('nan'), 0.5]}, {'x': 0.5}),
+    ({'id': [1, 2, 3], 'x': [0.5, float('nan'), 2.0]}, {'x': float('nan')}),
+    ({'id': [1, 2, 3], 'x': [0.5, 2.0, 2.0]}, {'x': 2}),
+])
+def test_compiled_matcher_agrees_with_pandas(compiled, table_data, where):
+    row_ids = ops._match_rows_compiled(table_data, where)
+
+    assert row_ids is not None
+    assert row_ids == ops._match_rows(table_data, where)
+
+
+@pytest.mark.parametrize('table_data, where', [
+    # int64 promoted to float64 would round 2**53 + 1 and match it
+    ({'id': [1, 2], 'n': [2**53, 2**53 + 1]}, {'n': float(2**53)}),
+    ({'id': [1, 2], 'x': [0.5, 2.0 ** 53]}, {'x': 2**53 + 1}),
+    ({'id': [1, 2], 'n': [1, 2], 'x': [0.5, 1.5]}, {'n': 1, 'x': 0.5}),
+    ({'id': [1, 2], 'n': [1, None]}, {'n': 1}),
+])
+def test_compiled_matcher_leaves_lossy_promotions_to_pandas(compiled, table_data, where):
+    assert ops._match_rows_compiled(table_data, where) is None
@@ -0,0 +1,226 @@
+import asyncio
+import importlib
+
+import pandas as pd
+
+from keyward.table_operations import TableOperations
+
+
+def test_add_data_coalesced_partial_failure_writes_each_caller_once(grist):
+    good = [{'n': i} for i in range(600)]
+    bad = [{'n': i} for i in range(600)]
+    bad[-1] = {'bad': True}
+
+    async def run():
+        return await asyncio.gather(
+            TableOperations.add_data('T', good),
+            TableOperations.add_data('T', bad),
+        )
+
+    good_ids, bad_ids = asyncio.run(run())
+
+    assert bad_ids is None
+    assert len(good_ids) == 600
+    assert grist.tables['T']['n'] == list(range(600))
+
+
+def test_add_data_coalesced_failure_only_fails_bad_caller(grist):
+    async def run():
+        return await asyncio.gather(
+            TableOperations.add_data('T', {'n': 1}),
+            TableOperations.add_data('T', {'bad': True}),
+            TableOperations.add_data('T', [{'n': 2}, {'n': 3}]),
+        )
+
+    first, failed, rest = asyncio.run(run())
+
+    assert failed is None
+    assert grist.tables['T']['n'] == [1, 2, 3]
+    assert len(first) == 1 and len(rest) == 2
+
+
+def test_bulk_delete_where_matches_list_values(grist):
+    grist.tables['T'] = {
+        'id': [1, 2, 3],
+        'manualSort': [1, 2, 3],
+        'tags': [['L', 'a'], ['L', 'b'], ['L', 'a']],
+        'n': [1, 1, 2],
+    }
+
+    assert asyncio.run(TableOperations.bulk_delete_where('T', {'tags': ['L', 'a'], 'n': 1}))
+
+    assert grist.tables['T']['id'] == [2, 3]
+
+
+def test_create_table_from_dataframe_keeps_non_string_labels(grist):
+    df = pd.DataFrame({0: [1.5, None], 'name': ['a', 'b']})
+
+    assert asyncio.run(TableOperations.create_table_from_dataframe('T', df)) == 'T'
+
+    assert grist.tables['T'][0] == [1.5, None]
+    assert grist.tables['T']['name'] == ['a', 'b']
+
+
+def test_add_data_lone_call_does_not_wait_for_coalesce_window(grist, monkeypatch):
+    ops = importlib.import_module('keyward.table_operations')
+    monkeypatch.setattr(ops._coalescer, 'flush_delay', 60)
+
+    async def run():
+        return await asyncio.wait_for(TableOperations.add_data('T', {'n': 1}), timeout=5)
+
+    assert asyncio.run(run()) == [1]
+
+
+def test_add_data_fallback_does_not_merge_different_key_sets(grist):
+    async def run():
+        return await asyncio.gather(
+            TableOperations.add_data('T', {'a': 1}),
+            TableOperations.add_data('T', {'b': 2}),
+            TableOperations.add_data('T', {'a': 3}),
+        )
+
+    asyncio.run(run())
+
+    creates = [records for op, _, records in grist.calls if op == 'create']
+    assert len(creates) == 2
+    assert [{'a': 1}, {'a': 3}] in creates and [{'b': 2}] in creates
+
+
+def test_bulk_delete_where_compares_large_ints_exactly(grist):
+    grist.tables['T'] = {
+        'id': [1, 2, 3],
+        'manualSort': [1, 2, 3],
+        'n': [2**53, 2**53 + 1, None],
+    }
+
+    assert asyncio.run(TableOperations.bulk_delete_where('T', {'n': 2**53}))
+
+    assert grist.tables['T']['id'] == [2, 3]
+
+
+def test_bulk_delete_where_none_matches_only_none(grist):
+    grist.tables['T'] = {
+        'id': [1, 2, 3],
+        'manualSort': [1, 2, 3],
+        'x': [None, float('nan'), 1.0],
+    }
+
+    assert asyncio.run(TableOperations.bulk_delete_where('T', {'x': None}))
+
+    assert grist.tables['T']['id'] == [2, 3]
+
+
+def _applied(grist):
+    return [actions for op, _, actions in grist.calls if op == 'apply']
+
+
+def test_user_actions_keep_column_defaults_for_mixed_key_sets(grist_doc_api):
+    records = [{'n': 1, 's': 'x'}, {'n': 2}, {'n': 3}, {'n': 4, 's': 'y'}]
+
+    async def run():
+        assert await TableOperations.create_table('T', {'n': 'Numeric', 's': 'Text'})
+        return await TableOperations.add_data('T', records)
+
+    assert asyncio.run(run()) == [1, 2, 3, 4]
+
+    table = grist_doc_api.tables['T']
+    assert table['n'] == [1, 2, 3, 4]
+    assert table['s'] == ['x', '', '', 'y']
+    # One request, with one BulkAddRecord per run of records sharing keys
+    assert [[action[0] for action in actions] for actions in _applied(grist_doc_api)[1:]] == [
+        ['BulkAddRecord', 'BulkAddRecord', 'BulkAddRecord'],
+    ]
+
+
+def test_user_actions_chunked_insert_keeps_row_order(grist_doc_api):
+    records = [{'n': i} for i in range(2500)]
+
+    async def run():
+        assert await TableOperations.create_table('T', {'n': 'Numeric'})
+        return await TableOperations.add_data('T', records)
+
+    assert asyncio.run(run()) == list(range(1, 2501))
+
+    assert grist_doc_api.tables['T']['n'] == list(range(2500))
+    assert [len(actions[0][2]) for actions in _applied(grist_doc_api)[1:]] == [1000, 1000, 500]
+
+
+def test_create_table_removes_renamed_table_and_accepts_existing(grist_doc_api):
+    grist_doc_api.tables['T'] = {'id': [1], 'manualSort': [1], 'n': [5]}
+
+    assert asyncio.run(TableOperations.create_table('T', {'n': 'Numeric'}))
+
+    assert set(grist_doc_api.tables) == {'T'}
+    assert grist_doc_api.tables['T']['n'] == [5]
+
+
+def test_create_table_fails_when_column_ids_are_renamed(grist_doc_api):
+    assert not asyncio.run(TableOperations.create_table('T', {'First Name': 'Text'}))
+
+    assert 'T' not in grist_doc_api.tables
+
+
+def test_create_table_from_dataframe_sends_frame_columns(grist_doc_api):
+    df = pd.DataFrame({'n': range(1500), 'x': [None, 1.5] * 750})
+
+    assert asyncio.run(TableOperations.create_table_from_dataframe('T', df)) == 'T'
+
+    table = grist_doc_api.tables['T']
+    assert table['id'] == list(range(1, 1501))
+    assert table['n'] == list(range(1500))
+    assert table['x'] == [None, 1.5] * 750
+    assert [len(actions[0][2]) for actions in _applied(grist_doc_api)[1:]] == [1000, 500]
+
+
+def _merge_sources(grist, sizes):
+    start = 0
+    for name, size in sizes.items():
+        ids = list(range(1, size + 1))
+        grist.tables[name] = {'id': ids, 'manualSort': ids, 'n': list(range(start, start + size))}
+        start += size
+    return start
+
+
+def test_merge_tables_writes_sources_in_order_after_creating_target(grist):
+    total = _merge_sources(grist, {'A': 2, 'B': 3, 'C': 1})
+    # The first source arrives last, yet must still be written first
+    grist.delays = {'A': 0.05, 'B': 0.01}
+
+    assert asyncio.run(TableOperations.merge_tables(['A', 'B', 'C'], 'T', create_new=True))
+
+    assert grist.tables['T']['n'] == list(range(total))
+    writes = [(op, len(payload)) for op, table, payload in grist.calls if table == 'T']
+    # Dummy record create and cleanup, then each source's rows
+    assert writes == [('create', 1), ('destroy', 1), ('create', 2), ('create', 3), ('create', 1)]
+
+
+def test_merge_tables_buffers_at_most_max_concurrency_sources(grist, monkeypatch):
+    ops = importlib.import_module('keyward.table_operations')
+    monkeypatch.setattr(ops, 'MAX_CONCURRENCY', 1)
+    _merge_sources(grist, {'A': 1, 'B': 1, 'C': 1})
+
+    assert asyncio.run(TableOperations.merge_tables(['A', 'B', 'C'], 'T'))
+
+    assert [(op, table) for op, table, _ in grist.calls] == [
+        ('fetch', 'A'), ('create', 'T'), ('fetch', 'B'), ('create', 'T'), ('fetch', 'C'), ('create', 'T'),
+    ]
+
+
+def test_merge_tables_keeps_source_order_across_chunks(grist):
+    total = _merge_sources(grist, {'A': 4000, 'B': 2500})
+
+    assert asyncio.run(TableOperations.merge_tables(['A', 'B'], 'T'))
+
+    assert grist.tables['T']['n'] == list(range(total))
+    # Chunks are sent one after another, so none can overtake another
+    assert grist.max_inflight_creates == 1
+
+
+def test_table_ops_handles_follow_a_replaced_client(grist, monkeypatch):
+    ops = importlib.import_module('keyward.table_operations')
+    first = ops._get_table_ops('T')
+    assert ops._get_table_ops('T') is first
+
+    monkeypatch.setattr(ops._get_gapi(), 'grist', type(grist)())
+
+    assert ops._get_table_ops('T').grist is ops._get_gapi().grist